@@ -1,36 +1,508 @@
+import asyncio
 import logging
 import subprocess
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk, scrolledtext
 from pathlib import Path
 import shutil
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 import tempfile
 import time
 import os
+import re
+import traceback
+from dataclasses import dataclass
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import markitdown
-import pytube
-from markdownify import markdownify
+from markdownify import MarkdownConverter
+
+# selectolax (lexbor) permite generar el Markdown recorriendo un árbol en C
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# aiohttp permite descargar varias páginas a la vez en un solo hilo
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# lxml analiza el HTML en C, mucho más rápido que html.parser puro Python
+try:
+    import lxml.html
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml = None
+    HTML_PARSER = "html.parser"
+
+logger = logging.getLogger(__name__)
+
+# Extensiones soportadas: la tupla conserva el orden para mostrar en la interfaz
+# y el frozenset permite comprobaciones de pertenencia en O(1)
+SUPPORTED_EXTENSIONS_TUPLE = (
+    '.pdf', '.docx', '.pptx', '.html', '.txt',
+    '.csv', '.xlsx', '.ppt', '.doc', '.xml'
+)
+SUPPORTED_EXTENSIONS = frozenset(SUPPORTED_EXTENSIONS_TUPLE)
 
 # Funciones de utilidad
 def get_supported_extensions():
-    return [
-        '.pdf', '.docx', '.pptx', '.html', '.txt',
-        '.csv', '.xlsx', '.ppt', '.doc', '.xml'
-    ]
+    return SUPPORTED_EXTENSIONS_TUPLE
 
 def ensure_directory_exists(directory):
     Path(directory).mkdir(parents=True, exist_ok=True)
 
+def write_markdown(output_path, markdown_content):
+    """
+    Escribe el Markdown en UTF-8 con os.write, sin la capa de texto de io.
+    
+    Se escribe primero en un archivo .part único junto al destino y se renombra
+    al final, de modo que output_path nunca queda con un contenido a medio
+    escribir, aunque dos conversiones escriban a la vez el mismo destino.
+    """
+    data = markdown_content.encode('utf-8')
+    directory, name = os.path.split(output_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.part', dir=directory or os.curdir)
+    try:
+        try:
+            # mkstemp crea el archivo solo para el propietario
+            os.chmod(tmp_path, 0o644)
+            # Reservar el espacio de una vez para salidas grandes y evitar fragmentación
+            if len(data) > 1024 * 1024 and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, len(data))
+                except OSError:
+                    pass
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+@lru_cache(maxsize=256)
+def derive_output_path(url, base="output_files"):
+    """Construye la ruta del Markdown de una página web a partir de su URL."""
+    parsed_url = urlparse(url)
+    domain = parsed_url.netloc.removeprefix("www.")
+    path = parsed_url.path.strip("/").replace("/", "_") or "index"
+    return str(Path(base) / f"{domain}_{path}.md")
+
+# Identificador de 11 caracteres en URLs watch?v=, youtu.be/, /shorts/ y /embed/
+_YT_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([\w-]{11})')
+
+def youtube_video_id(url):
+    """Extrae el identificador de un video de YouTube, o 'video' si no se encuentra."""
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else 'video'
+
+# Endpoint oEmbed de YouTube: devuelve los metadatos básicos de un video en JSON
+YOUTUBE_OEMBED_URL = "https://www.youtube.com/oembed"
+
+def discard_directory(directory):
+    """
+    Elimina un directorio sin retrasar la salida del programa.
+    
+    El directorio se renombra (operación atómica e inmediata) y se borra en un
+    hilo de fondo; si el proceso termina antes, sweep_discarded_directories lo
+    borra en el siguiente arranque.
+    """
+    directory = Path(directory)
+    trash = directory.with_name(f".{directory.name}.trash_{os.getpid()}")
+    try:
+        directory.rename(trash)
+    except OSError:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
+
+def sweep_discarded_directories(directory):
+    """Borra en segundo plano los restos de discard_directory de ejecuciones anteriores."""
+    directory = Path(directory)
+    leftovers = list(directory.parent.glob(f".{directory.name}.trash_*"))
+    if not leftovers:
+        return
+    
+    def sweep():
+        for leftover in leftovers:
+            shutil.rmtree(leftover, ignore_errors=True)
+    
+    threading.Thread(target=sweep, daemon=True).start()
+
+# Pool de hilos compartido por todos los conversores. Las tareas esperan sobre todo
+# a subprocesos de docling o a la red, así que se admiten más hilos que núcleos;
+# el tamaño se puede ajustar con la variable de entorno OCR_TO_MARKDOWN_WORKERS
+def _max_workers_from_env():
+    """Lee OCR_TO_MARKDOWN_WORKERS, o usa el valor por defecto si falta o no es válido."""
+    default = min(32, (os.cpu_count() or 1) * 2)
+    value = os.environ.get("OCR_TO_MARKDOWN_WORKERS")
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("OCR_TO_MARKDOWN_WORKERS no es un entero válido (%r), se usarán %d hilos", value, default)
+        return default
+
+MAX_WORKERS = _max_workers_from_env()
+_SHARED_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Archivos de la cola que se precargan por delante de los que se están convirtiendo
+PREFETCH_DEPTH = 4
+
+def prefetch_file(path):
+    """Pide al kernel que lea un archivo por adelantado sin bloquear (solo POSIX)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class _LexborMarkdownRenderer:
+    """Genera Markdown directamente desde un árbol de selectolax/lexbor."""
+    
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _BLANK_LINES_RE = re.compile(r'\n{3,}')
+    # Caracteres que en el texto plano se leerían como sintaxis de Markdown
+    _ESCAPE_RE = re.compile(r'([\\`*_\[\]])')
+    _BACKTICKS_RE = re.compile(r'`+')
+    _SKIPPED_TAGS = frozenset(('head', 'script', 'style', 'noscript', 'template', '-comment'))
+    
+    def __init__(self):
+        self._handlers = {
+            '-text': self._text,
+            'h1': self._heading, 'h2': self._heading, 'h3': self._heading,
+            'h4': self._heading, 'h5': self._heading, 'h6': self._heading,
+            'p': self._block, 'div': self._block, 'section': self._block,
+            'article': self._block, 'header': self._block, 'footer': self._block,
+            'br': self._line_break,
+            'hr': self._rule,
+            'a': self._link,
+            'img': self._image,
+            'strong': self._strong, 'b': self._strong,
+            'em': self._emphasis, 'i': self._emphasis,
+            'code': self._code,
+            'pre': self._pre,
+            'blockquote': self._blockquote,
+            'ul': self._list, 'ol': self._list,
+            'table': self._table,
+        }
+    
+    def render(self, html):
+        tree = LexborHTMLParser(html)
+        root = tree.body or tree.root
+        out = []
+        self._children(root, out, 0)
+        return self._BLANK_LINES_RE.sub('\n\n', ''.join(out)).strip() + '\n'
+    
+    def _node(self, node, out, depth):
+        tag = node.tag
+        if tag in self._SKIPPED_TAGS:
+            return
+        handler = self._handlers.get(tag)
+        if handler is None:
+            self._children(node, out, depth)
+        else:
+            handler(node, out, depth)
+    
+    def _children(self, node, out, depth):
+        for child in node.iter(include_text=True):
+            self._node(child, out, depth)
+    
+    def _inline(self, node, depth):
+        out = []
+        self._children(node, out, depth)
+        return ''.join(out).strip()
+    
+    def _edge_spaces(self, node, out):
+        """Devuelve los espacios que un elemento en línea debe dejar fuera de sus marcas."""
+        raw = node.text(deep=True)
+        # Como en _text, no se repite un espacio ni se empieza una línea con él
+        lead = ' ' if raw[:1].isspace() and out and not out[-1].endswith(('\n', ' ')) else ''
+        trail = ' ' if raw[-1:].isspace() else ''
+        return lead, trail
+    
+    def _wrap(self, node, out, depth, before, after):
+        """Envuelve el contenido de un elemento en marcas, con los espacios de los bordes fuera."""
+        lead, trail = self._edge_spaces(node, out)
+        text = self._inline(node, depth)
+        if text:
+            out.append(f"{lead}{before}{text}{after}{trail}")
+        elif lead or (trail and out and not out[-1].endswith(('\n', ' '))):
+            out.append(' ')
+    
+    def _text(self, node, out, depth):
+        text = self._WHITESPACE_RE.sub(' ', node.text(deep=False))
+        # El espacio al inicio de una línea no es significativo en Markdown, y
+        # el HTML colapsa los espacios seguidos aunque vengan de nodos distintos
+        if not out or out[-1].endswith(('\n', ' ')):
+            text = text.lstrip()
+        if text:
+            out.append(self._ESCAPE_RE.sub(r'\\\1', text))
+    
+    def _heading(self, node, out, depth):
+        out.append(f"\n\n{'#' * int(node.tag[1])} {self._inline(node, depth)}\n\n")
+    
+    def _block(self, node, out, depth):
+        out.append('\n\n')
+        self._children(node, out, depth)
+        out.append('\n\n')
+    
+    def _line_break(self, node, out, depth):
+        out.append('  \n')
+    
+    def _rule(self, node, out, depth):
+        out.append('\n\n---\n\n')
+    
+    def _link(self, node, out, depth):
+        href = node.attributes.get('href')
+        if href:
+            self._wrap(node, out, depth, '[', f"]({href})")
+        else:
+            self._wrap(node, out, depth, '', '')
+    
+    def _image(self, node, out, depth):
+        attrs = node.attributes
+        src = attrs.get('src')
+        if src:
+            out.append(f"![{attrs.get('alt') or ''}]({src})")
+    
+    def _strong(self, node, out, depth):
+        self._wrap(node, out, depth, '**', '**')
+    
+    def _emphasis(self, node, out, depth):
+        self._wrap(node, out, depth, '*', '*')
+    
+    def _longest_backticks(self, text):
+        return max(map(len, self._BACKTICKS_RE.findall(text)), default=0)
+    
+    def _code(self, node, out, depth):
+        text = node.text(deep=True)
+        # La valla debe ser más larga que cualquier secuencia de comillas del
+        # código, y el espacio de relleno evita que se junten con ella
+        longest = self._longest_backticks(text)
+        fence = '`' * (longest + 1)
+        pad = ' ' if longest else ''
+        out.append(f"{fence}{pad}{text}{pad}{fence}")
+    
+    def _pre(self, node, out, depth):
+        text = node.text(deep=True).strip('\n')
+        fence = '`' * max(3, self._longest_backticks(text) + 1)
+        out.append(f"\n\n{fence}\n{text}\n{fence}\n\n")
+    
+    def _blockquote(self, node, out, depth):
+        text = self._BLANK_LINES_RE.sub('\n\n', self._inline(node, depth))
+        quoted = '\n'.join(f"> {line}" if line else '>' for line in text.split('\n'))
+        out.append(f"\n\n{quoted}\n\n")
+    
+    def _list(self, node, out, depth):
+        ordered = node.tag == 'ol'
+        number = 1
+        out.append('\n' if depth else '\n\n')
+        for child in node.iter(include_text=False):
+            if child.tag != 'li':
+                continue
+            marker = f"{number}." if ordered else '-'
+            number += 1
+            item = self._BLANK_LINES_RE.sub('\n\n', self._inline(child, depth + 1))
+            # Las líneas siguientes (párrafos, listas anidadas) se sangran con el
+            # ancho de la marca para que sigan dentro del elemento
+            pad = ' ' * (len(marker) + 1)
+            first, *rest = item.split('\n')
+            item = '\n'.join([first, *(line and pad + line for line in rest)])
+            out.append(f"{marker} {item}\n")
+        out.append('\n' if depth else '\n\n')
+    
+    def _table_rows(self, node):
+        """Devuelve las filas de una tabla, sin entrar en tablas anidadas."""
+        for child in node.iter(include_text=False):
+            if child.tag == 'tr':
+                yield child
+            elif child.tag in ('thead', 'tbody', 'tfoot'):
+                yield from self._table_rows(child)
+    
+    def _table(self, node, out, depth):
+        rows = []
+        for tr in self._table_rows(node):
+            cells = [
+                self._WHITESPACE_RE.sub(' ', self._inline(cell, depth)).replace('|', '\\|')
+                for cell in tr.iter(include_text=False) if cell.tag in ('td', 'th')
+            ]
+            if cells:
+                rows.append(cells)
+        if not rows:
+            return
+        # La primera fila hace de cabecera, como en markdownify
+        width = max(len(row) for row in rows)
+        lines = []
+        for index, row in enumerate(rows):
+            row += [''] * (width - len(row))
+            lines.append(f"| {' | '.join(row)} |")
+            if index == 0:
+                lines.append(f"| {' | '.join(['---'] * width)} |")
+        out.append('\n\n' + '\n'.join(lines) + '\n\n')
+
+_thread_local = threading.local()
+
+def _parse_html(text):
+    """Analiza HTML con lxml, reutilizando un parser por hilo."""
+    parser = getattr(_thread_local, 'html_parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+        _thread_local.html_parser = parser
+    return lxml.html.document_fromstring(text, parser=parser)
+
+def html_to_markdown(html):
+    """Convierte HTML a Markdown, con selectolax si está disponible o markdownify si no."""
+    if LexborHTMLParser is not None:
+        try:
+            return _LexborMarkdownRenderer().render(html)
+        except Exception as e:
+            logger.warning("selectolax no pudo convertir el HTML, se usará markdownify: %s", e)
+    
+    # Analizar el HTML una sola vez con HTML_PARSER
+    soup = BeautifulSoup(html, HTML_PARSER)
+    return MarkdownConverter().convert_soup(soup)
+
+def _import_tk():
+    """Importa tkinter bajo demanda para que el módulo pueda usarse sin interfaz."""
+    global tk, filedialog, messagebox, ttk, scrolledtext
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk, scrolledtext
+
+def _drain_pipe(pipe, lines):
+    """Lee una tubería línea a línea hasta EOF, acumulando en lines."""
+    with pipe:
+        for line in iter(pipe.readline, ''):
+            lines.append(line)
+
+def run_docling(input_path, output_path, progress_callback=None, cancel_event=None, file_size=None):
+    """
+    Ejecuta la CLI de docling sobre un archivo, sin depender de la interfaz.
+    
+    Args:
+        input_path: Ruta del archivo a convertir
+        output_path: Ruta donde guardar el archivo convertido
+        progress_callback: Función para reportar el progreso (10-100)
+        cancel_event: threading.Event que, al activarse, termina docling
+        file_size: Tamaño del archivo en bytes, si ya se conoce
+        
+    Returns:
+        True si la conversión fue exitosa, False en caso contrario
+    """
+    # Ejecutar docling con opciones optimizadas
+    cmd = ["docling", input_path, "--output", output_path]
+    
+    # Para archivos grandes, añadir opciones de optimización si están disponibles
+    if file_size is None:
+        file_size = os.stat(input_path).st_size
+    if file_size > 5 * 1024 * 1024:  # 5MB
+        # Añadir opciones para optimizar el procesamiento de archivos grandes
+        # (estas opciones dependen de las capacidades de docling)
+        cmd.extend(["--optimize-large-files"])
+    
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    
+    # Monitorear el progreso
+    stdout_lines = []
+    stderr_lines = []
+    
+    # Vaciar stdout y stderr en hilos propios para que ninguna tubería
+    # se llene y bloquee a docling mientras esperamos a la otra
+    readers = [
+        threading.Thread(target=_drain_pipe, args=(process.stdout, stdout_lines), daemon=True),
+        threading.Thread(target=_drain_pipe, args=(process.stderr, stderr_lines), daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+    
+    last_progress = 10
+    last_progress_time = time.monotonic()
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            process.terminate()
+            logger.info("Conversión cancelada por el usuario")
+            return False
+        
+        # Esperar la salida del proceso; vuelve en cuanto termina
+        try:
+            process.wait(timeout=0.05)
+            break
+        except subprocess.TimeoutExpired:
+            pass
+        
+        # Actualizar progreso (estimado)
+        if progress_callback:
+            # Incrementar progreso gradualmente hasta 90%
+            # El 100% se reportará al finalizar
+            # Solo se notifica si el valor cambia, y como mucho 10 veces por segundo
+            progress = min(90, 10 + len(stdout_lines) * 2)
+            now = time.monotonic()
+            if progress != last_progress and now - last_progress_time >= 0.1:
+                progress_callback(progress)
+                last_progress = progress
+                last_progress_time = now
+    
+    # Esperar a que se lea cualquier salida restante
+    for reader in readers:
+        reader.join()
+    
+    if process.returncode == 0:
+        logger.info("Archivo convertido exitosamente: %s -> %s", input_path, output_path)
+        if progress_callback:
+            progress_callback(100)
+        return True
+    else:
+        error_msg = ''.join(stderr_lines)
+        logger.error("Error al convertir %s: %s", input_path, error_msg)
+        return False
+
+def _cancelled(cancel_event):
+    """Indica si se pidió cancelar la conversión asociada a cancel_event."""
+    if cancel_event is not None and cancel_event.is_set():
+        logger.info("Conversión cancelada por el usuario")
+        return True
+    return False
+
 class WebToMarkdownConverter:
     def __init__(self):
         self.cancel_requested = False
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = _SHARED_POOL
+        # Sesión reutilizada: mantiene las conexiones abiertas entre descargas
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def convert_url(self, url, output_path=None, progress_callback=None):
+    def convert_url(self, url, output_path=None, progress_callback=None, cancel_event=None):
         """
         Convierte una página web a formato Markdown.
         
@@ -38,6 +510,7 @@ class WebToMarkdownConverter:
             url: URL de la página web a convertir
             output_path: Ruta donde guardar el archivo convertido
             progress_callback: Función para reportar el progreso (0-100)
+            cancel_event: threading.Event que, al activarse, evita escribir el resultado
             
         Returns:
             True si la conversión fue exitosa, False en caso contrario
@@ -50,19 +523,12 @@ class WebToMarkdownConverter:
             is_youtube = "youtube.com" in url or "youtu.be" in url
             
             if is_youtube:
-                return self.convert_youtube(url, output_path, progress_callback)
+                return self.convert_youtube(url, output_path, progress_callback, cancel_event)
             
             # Preparar la ruta de salida
             if output_path is None:
                 # Extraer un nombre de archivo de la URL
-                from urllib.parse import urlparse
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc.replace("www.", "")
-                path = parsed_url.path.strip("/").replace("/", "_")
-                if not path:
-                    path = "index"
-                output_filename = f"{domain}_{path}.md"
-                output_path = str(Path("output_files") / output_filename)
+                output_path = derive_output_path(url)
             
             ensure_directory_exists(Path(output_path).parent)
             
@@ -70,35 +536,125 @@ class WebToMarkdownConverter:
                 progress_callback(20)
             
             # Descargar la página web
-            logging.info(f"Descargando: {url}")
-            response = requests.get(url)
-            response.raise_for_status()
+            logger.info("Descargando: %s", url)
+            with self.session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                html = response.text
             
             if progress_callback:
                 progress_callback(50)
             
             # Convertir HTML a Markdown usando markdownify
-            logging.info("Convirtiendo HTML a Markdown")
-            markdown_content = markdownify(response.text)
+            logger.info("Convirtiendo HTML a Markdown")
+            markdown_content = html_to_markdown(html)
             
             if progress_callback:
                 progress_callback(80)
             
+            if _cancelled(cancel_event):
+                return False
+            
             # Guardar el resultado
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_markdown(output_path, markdown_content)
             
             if progress_callback:
                 progress_callback(100)
                 
-            logging.info(f"Conversión completada: {output_path}")
+            logger.info("Conversión completada: %s", output_path)
             return True
             
         except Exception as e:
-            logging.error(f"Error al convertir URL: {e}")
+            logger.error("Error al convertir URL: %s", e)
             return False
     
-    def convert_youtube(self, url, output_path=None, progress_callback=None):
+    async def convert_url_aio(self, session, url, output_path=None, progress_callback=None, cancel_event=None):
+        """
+        Convierte una página web a formato Markdown descargándola con aiohttp.
+        
+        El análisis del HTML y la escritura se ejecutan en el pool de hilos para
+        no bloquear el bucle de eventos.
+        
+        Args:
+            session: aiohttp.ClientSession con la que descargar la página
+            url: URL de la página web a convertir
+            output_path: Ruta donde guardar el archivo convertido
+            progress_callback: Función para reportar el progreso (0-100)
+            cancel_event: threading.Event que, al activarse, evita escribir el resultado
+            
+        Returns:
+            True si la conversión fue exitosa, False en caso contrario
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if progress_callback:
+                progress_callback(10)
+            
+            # Los videos de YouTube usan su propio conversor síncrono
+            if "youtube.com" in url or "youtu.be" in url:
+                return await loop.run_in_executor(
+                    self.executor, self.convert_youtube, url, output_path, progress_callback, cancel_event
+                )
+            
+            if output_path is None:
+                output_path = derive_output_path(url)
+            
+            ensure_directory_exists(Path(output_path).parent)
+            
+            if progress_callback:
+                progress_callback(20)
+            
+            logger.info("Descargando: %s", url)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                html = await response.text()
+            
+            if progress_callback:
+                progress_callback(50)
+            
+            logger.info("Convirtiendo HTML a Markdown")
+            markdown_content = await loop.run_in_executor(self.executor, html_to_markdown, html)
+            
+            if progress_callback:
+                progress_callback(80)
+            
+            if _cancelled(cancel_event):
+                return False
+            
+            await loop.run_in_executor(self.executor, write_markdown, output_path, markdown_content)
+            
+            if progress_callback:
+                progress_callback(100)
+            
+            logger.info("Conversión completada: %s", output_path)
+            return True
+            
+        except Exception as e:
+            logger.error("Error al convertir URL: %s", e)
+            return False
+    
+    async def _convert_urls(self, urls):
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+            return await asyncio.gather(*(self.convert_url_aio(session, url) for url in urls))
+    
+    def convert_urls(self, urls):
+        """
+        Convierte varias URLs a Markdown en paralelo.
+        
+        Con aiohttp todas las descargas se solapan en un único bucle de eventos;
+        sin él, cada URL se convierte en un hilo del pool compartido.
+        
+        Args:
+            urls: URLs a convertir; cada una se guarda en su ruta por defecto
+            
+        Returns:
+            Lista con el resultado (True/False) de cada URL, en el mismo orden
+        """
+        if aiohttp is None:
+            futures = [self.executor.submit(self.convert_url, url) for url in urls]
+            return [future.result() for future in futures]
+        return asyncio.run(self._convert_urls(urls))
+    
+    def convert_youtube(self, url, output_path=None, progress_callback=None, cancel_event=None):
         """
         Convierte un video de YouTube a formato Markdown.
         
@@ -106,6 +662,7 @@ class WebToMarkdownConverter:
             url: URL del video de YouTube
             output_path: Ruta donde guardar el archivo convertido
             progress_callback: Función para reportar el progreso (0-100)
+            cancel_event: threading.Event que, al activarse, evita escribir el resultado
             
         Returns:
             True si la conversión fue exitosa, False en caso contrario
@@ -117,10 +674,7 @@ class WebToMarkdownConverter:
             # Preparar la ruta de salida
             if output_path is None:
                 # Extraer un nombre de archivo de la URL
-                from urllib.parse import urlparse
-                parsed_url = urlparse(url)
-                video_id = parsed_url.query.split('v=')[-1].split('&')[0] if 'v=' in parsed_url.query else parsed_url.path.split('/')[-1]
-                output_filename = f"youtube_{video_id}.md"
+                output_filename = f"youtube_{youtube_video_id(url)}.md"
                 output_path = str(Path("output_files") / output_filename)
             
             ensure_directory_exists(Path(output_path).parent)
@@ -128,45 +682,86 @@ class WebToMarkdownConverter:
             if progress_callback:
                 progress_callback(30)
             
-            # Usar pytube para obtener información del video
-            logging.info(f"Procesando video de YouTube: {url}")
-            from pytube import YouTube
-            yt = YouTube(url)
+            # Obtener título, autor y miniatura con el endpoint oEmbed de YouTube,
+            # una sola petición JSON en lugar de analizar la página y el reproductor
+            logger.info("Procesando video de YouTube: %s", url)
+            with self.session.get(YOUTUBE_OEMBED_URL, params={"url": url, "format": "json"}, timeout=10) as response:
+                response.raise_for_status()
+                meta = response.json()
             
             if progress_callback:
                 progress_callback(50)
             
             # Crear contenido Markdown con la información del video
-            title = yt.title
-            author = yt.author
-            description = yt.description
-            thumbnail_url = yt.thumbnail_url
-            
-            markdown_content = f"# {title}\n\n"
-            markdown_content += f"**Autor:** {author}\n\n"
-            markdown_content += f"**URL:** {url}\n\n"
-            markdown_content += f"![Thumbnail]({thumbnail_url})\n\n"
-            markdown_content += "## Descripción\n\n"
-            markdown_content += description.replace('\n', '\n\n')
+            title = meta["title"]
+            author = meta["author_name"]
+            description = self._fetch_youtube_description(url)
+            thumbnail_url = meta["thumbnail_url"]
+            
+            markdown_content = "".join((
+                f"# {title}\n\n",
+                f"**Autor:** {author}\n\n",
+                f"**URL:** {url}\n\n",
+                f"![Thumbnail]({thumbnail_url})\n\n",
+                "## Descripción\n\n",
+                description.replace('\n', '\n\n')
+            ))
             
             if progress_callback:
                 progress_callback(80)
             
+            if _cancelled(cancel_event):
+                return False
+            
             # Guardar el resultado
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_markdown(output_path, markdown_content)
             
             if progress_callback:
                 progress_callback(100)
                 
-            logging.info(f"Conversión completada: {output_path}")
+            logger.info("Conversión completada: %s", output_path)
             return True
             
         except Exception as e:
-            logging.error(f"Error al convertir video de YouTube: {e}")
+            logger.error("Error al convertir video de YouTube: %s", e)
             return False
     
-    def convert_url_async(self, url, output_path=None, progress_callback=None, completion_callback=None):
+    def _fetch_youtube_description(self, url):
+        """
+        Obtiene la descripción de un video desde las etiquetas meta de su página.
+        
+        Args:
+            url: URL del video de YouTube
+            
+        Returns:
+            La descripción, o una cadena vacía si no se pudo obtener
+        """
+        try:
+            with self.session.get(url, timeout=10) as response:
+                response.raise_for_status()
+                html = response.text
+        except requests.RequestException as e:
+            logger.warning("No se pudo obtener la descripción del video: %s", e)
+            return ""
+        
+        if lxml is not None:
+            # Un único análisis en C y consultas XPath sobre el árbol
+            try:
+                tree = _parse_html(html)
+            except (ValueError, lxml.etree.ParserError) as e:
+                logger.warning("No se pudo analizar la página del video: %s", e)
+                return ""
+            content = (tree.xpath('//meta[@name="description"]/@content')
+                       or tree.xpath('//meta[@property="og:description"]/@content'))
+            return content[0] if content else ""
+        
+        # Analizar solo las etiquetas <meta>, no la página completa
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("meta"))
+        tag = soup.find("meta", attrs={"name": "description"}) or soup.find("meta", attrs={"property": "og:description"})
+        return tag.get("content", "") if tag else ""
+    
+    def convert_url_async(self, url, output_path=None, progress_callback=None, completion_callback=None,
+                          cancel_event=None):
         """
         Convierte una URL a Markdown de forma asíncrona.
         
@@ -175,9 +770,10 @@ class WebToMarkdownConverter:
             output_path: Ruta donde guardar el archivo convertido
             progress_callback: Función para reportar el progreso
             completion_callback: Función a llamar cuando se complete la conversión
+            cancel_event: threading.Event que, al activarse, evita escribir el resultado
         """
         def task():
-            result = self.convert_url(url, output_path, progress_callback)
+            result = self.convert_url(url, output_path, progress_callback, cancel_event)
             if completion_callback:
                 completion_callback(result, output_path)
         
@@ -190,11 +786,37 @@ class WebToMarkdownConverter:
 
 class DoclingToMarkdownConverter:
     def __init__(self):
-        self.process = None
-        self.cancel_requested = False
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        # Eventos de cancelación de las conversiones en curso, uno por llamada
+        self._cancel_events = set()
+        self._cancel_events_lock = threading.Lock()
+        self.executor = _SHARED_POOL
+        
+        # Un único DocumentConverter reutilizado evita pagar la carga de docling
+        # y sus modelos en cada archivo, como ocurre al lanzar la CLI. Se crea en
+        # la primera conversión para no retrasar el arranque ni el modo web
+        self._document_converter = None
+        self._document_converter_failed = False
+        self._document_converter_lock = threading.Lock()
     
-    def convert_file(self, input_path, output_path=None, progress_callback=None):
+    def _get_document_converter(self):
+        """
+        Devuelve el DocumentConverter compartido, creándolo en el primer uso.
+        
+        Returns:
+            El conversor de docling, o None si no se pudo cargar y hay que usar la CLI
+        """
+        with self._document_converter_lock:
+            if self._document_converter is None and not self._document_converter_failed:
+                try:
+                    from docling.document_converter import DocumentConverter
+                    self._document_converter = DocumentConverter()
+                except Exception as e:
+                    # No se reintenta en cada archivo: a partir de aquí se usa la CLI
+                    self._document_converter_failed = True
+                    logger.warning("No se pudo inicializar docling, se usará la CLI: %s", e)
+            return self._document_converter
+    
+    def convert_file(self, input_path, output_path=None, progress_callback=None, *, stat_result=None):
         """
         Convierte un archivo a formato Markdown usando docling.
         
@@ -202,102 +824,94 @@ class DoclingToMarkdownConverter:
             input_path: Ruta del archivo a convertir
             output_path: Ruta donde guardar el archivo convertido
             progress_callback: Función para reportar el progreso (0-100)
+            stat_result: os.stat_result ya conocido del archivo (p. ej. de os.scandir)
             
         Returns:
             True si la conversión fue exitosa, False en caso contrario
         """
         try:
-            if not Path(input_path).exists():
-                logging.error(f"El archivo no existe: {input_path}")
-                return False
+            # Un único stat sirve para comprobar que existe y para conocer su tamaño
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(input_path)
+                except OSError:
+                    logger.error("El archivo no existe: %s", input_path)
+                    return False
             
-            if Path(input_path).suffix.lower() not in get_supported_extensions():
-                logging.error(f"Formato no soportado: {input_path}")
+            if os.path.splitext(input_path)[1].lower() not in SUPPORTED_EXTENSIONS:
+                logger.error("Formato no soportado: %s", input_path)
                 return False
             
             if output_path is None:
-                input_path_obj = Path(input_path)
-                output_filename = input_path_obj.stem + '.md'
-                output_path = str(Path("output_files") / output_filename)
-            ensure_directory_exists(Path(output_path).parent)
-            
-            # Reiniciar el estado de cancelación
-            self.cancel_requested = False
-            
-            logging.info(f"Convirtiendo: {input_path}")
-            
-            # Reportar inicio de progreso
-            if progress_callback:
-                progress_callback(10)
-            
-            # Ejecutar docling con opciones optimizadas
-            cmd = ["docling", input_path, "--output", output_path]
-            
-            # Para archivos grandes, añadir opciones de optimización si están disponibles
-            file_size = Path(input_path).stat().st_size
-            if file_size > 5 * 1024 * 1024:  # 5MB
-                # Añadir opciones para optimizar el procesamiento de archivos grandes
-                # (estas opciones dependen de las capacidades de docling)
-                cmd.extend(["--optimize-large-files"])
-            
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-            
-            # Monitorear el progreso
-            stdout_lines = []
-            stderr_lines = []
+                output_filename = os.path.splitext(os.path.basename(input_path))[0] + '.md'
+                output_path = os.path.join("output_files", output_filename)
+            ensure_directory_exists(os.path.dirname(output_path))
             
-            while self.process.poll() is None:
-                if self.cancel_requested:
-                    self.process.terminate()
-                    logging.info("Conversión cancelada por el usuario")
-                    return False
-                
-                # Leer salida sin bloquear
-                stdout_line = self.process.stdout.readline()
-                if stdout_line:
-                    stdout_lines.append(stdout_line)
+            # Cada llamada tiene su propio evento: una conversión nueva no puede
+            # anular la cancelación de otra que aún no ha terminado
+            cancel_event = threading.Event()
+            with self._cancel_events_lock:
+                self._cancel_events.add(cancel_event)
+            try:
+                logger.info("Convirtiendo: %s", input_path)
                 
-                stderr_line = self.process.stderr.readline()
-                if stderr_line:
-                    stderr_lines.append(stderr_line)
-                
-                # Actualizar progreso (estimado)
+                # Reportar inicio de progreso
                 if progress_callback:
-                    # Incrementar progreso gradualmente hasta 90%
-                    # El 100% se reportará al finalizar
-                    progress_callback(min(90, 10 + len(stdout_lines) * 2))
+                    progress_callback(10)
                 
-                time.sleep(0.1)
-            
-            # Leer cualquier salida restante
-            stdout, stderr = self.process.communicate()
-            if stdout:
-                stdout_lines.append(stdout)
-            if stderr:
-                stderr_lines.append(stderr)
-            
-            if self.process.returncode == 0:
-                logging.info(f"Archivo convertido exitosamente: {input_path} -> {output_path}")
-                if progress_callback:
-                    progress_callback(100)
-                return True
-            else:
-                error_msg = ''.join(stderr_lines)
-                logging.error(f"Error al convertir {input_path}: {error_msg}")
-                return False
+                document_converter = self._get_document_converter()
+                if document_converter is not None:
+                    return self._convert_in_process(
+                        document_converter, input_path, output_path, progress_callback, cancel_event
+                    )
+                
+                return run_docling(input_path, output_path, progress_callback, cancel_event, stat_result.st_size)
+            finally:
+                with self._cancel_events_lock:
+                    self._cancel_events.discard(cancel_event)
             
         except Exception as e:
-            logging.error(f"Error al convertir {input_path}: {str(e)}")
-            import traceback
+            logger.error("Error al convertir %s: %s", input_path, e)
             traceback.print_exc()
             return False
     
+    def _convert_in_process(self, document_converter, input_path, output_path, progress_callback=None,
+                            cancel_event=None):
+        """
+        Convierte un archivo con la API de docling sin lanzar un subproceso.
+        
+        Args:
+            document_converter: DocumentConverter de docling ya inicializado
+            input_path: Ruta del archivo a convertir
+            output_path: Ruta donde guardar el archivo convertido
+            progress_callback: Función para reportar el progreso (0-100)
+            cancel_event: threading.Event de esta conversión; si se activa no se escribe la salida
+            
+        Returns:
+            True si la conversión fue exitosa, False en caso contrario
+        """
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
+        # El conversor comparte modelos y caché de pipelines entre llamadas,
+        # así que las conversiones en el mismo proceso se serializan
+        with self._document_converter_lock:
+            if cancel_event.is_set():
+                logger.info("Conversión cancelada por el usuario")
+                return False
+            result = document_converter.convert(input_path)
+        
+        if cancel_event.is_set():
+            logger.info("Conversión cancelada por el usuario")
+            return False
+        
+        write_markdown(output_path, result.document.export_to_markdown())
+        
+        logger.info("Archivo convertido exitosamente: %s -> %s", input_path, output_path)
+        if progress_callback:
+            progress_callback(100)
+        return True
+    
     def convert_file_async(self, input_path, output_path=None, progress_callback=None, completion_callback=None):
         """
         Convierte un archivo de forma asíncrona.
@@ -316,8 +930,10 @@ class DoclingToMarkdownConverter:
         self.executor.submit(_convert_and_notify)
     
     def cancel_conversion(self):
-        """Cancela la conversión en curso"""
-        self.cancel_requested = True
+        """Cancela las conversiones en curso"""
+        with self._cancel_events_lock:
+            for cancel_event in self._cancel_events:
+                cancel_event.set()
     
     def convert_directory(self, input_dir, output_dir, progress_callback=None, completion_callback=None):
         """
@@ -331,7 +947,6 @@ class DoclingToMarkdownConverter:
         """
         ensure_directory_exists(output_dir)
         
-        input_path = Path(input_dir)
         stats = {
             'total_files': 0,
             'converted': 0,
@@ -341,55 +956,63 @@ class DoclingToMarkdownConverter:
         }
         
         # Contar archivos primero para calcular el progreso
-        supported_extensions = get_supported_extensions()
+        # os.scandir reutiliza la información de readdir y evita un stat() por entrada;
+        # solo los enlaces simbólicos necesitan un stat extra para seguirlos
         files_to_convert = []
         
-        for file_path in input_path.iterdir():
-            if file_path.is_file():
-                stats['total_files'] += 1
-                
-                if file_path.suffix.lower() in supported_extensions:
-                    files_to_convert.append(file_path)
-                else:
-                    stats['skipped'] += 1
-                    logging.info(f"Archivo omitido (formato no soportado): {file_path.name}")
+        with os.scandir(input_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    stats['total_files'] += 1
+                    
+                    if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        files_to_convert.append(entry)
+                    else:
+                        stats['skipped'] += 1
+                        logger.info("Archivo omitido (formato no soportado): %s", entry.name)
         
         if not files_to_convert:
             if completion_callback:
                 completion_callback(stats)
             return stats
         
-        # Función para actualizar el progreso
-        def update_progress():
-            if progress_callback:
-                progress = (stats['converted'] + stats['failed']) / len(files_to_convert) * 100
-                progress_callback(progress)
-        
-        # Callback para cada archivo convertido
-        def file_converted(success, output_path, file_path):
-            if success:
+        # Precargar, antes de enviarlos, los archivos que tomarán los hilos y unos
+        # pocos más; cada archivo terminado adelanta uno, para que su lectura se
+        # solape con la conversión actual
+        prefetch_index = min(len(files_to_convert), MAX_WORKERS + PREFETCH_DEPTH)
+        for entry in files_to_convert[:prefetch_index]:
+            prefetch_file(entry.path)
+        
+        # Enviar todos los archivos al pool y procesar los resultados según terminan
+        futures = []
+        for entry in files_to_convert:
+            output_filename = os.path.splitext(entry.name)[0] + '.md'
+            output_path = os.path.join(output_dir, output_filename)
+            
+            stats['in_progress'] += 1
+            futures.append(self.executor.submit(
+                self.convert_file, entry.path, output_path,
+                stat_result=entry.stat()
+            ))
+        
+        for future in as_completed(futures):
+            if prefetch_index < len(files_to_convert):
+                prefetch_file(files_to_convert[prefetch_index].path)
+                prefetch_index += 1
+            
+            if future.result():
                 stats['converted'] += 1
             else:
                 stats['failed'] += 1
             
             stats['in_progress'] -= 1
-            update_progress()
             
-            # Verificar si hemos terminado
-            if stats['converted'] + stats['failed'] == len(files_to_convert):
-                if completion_callback:
-                    completion_callback(stats)
+            if progress_callback:
+                progress = (stats['converted'] + stats['failed']) / len(files_to_convert) * 100
+                progress_callback(progress)
         
-        # Iniciar conversión de cada archivo
-        for file_path in files_to_convert:
-            output_filename = file_path.stem + '.md'
-            output_path = str(Path(output_dir) / output_filename)
-            
-            # Usar una función lambda para capturar el file_path actual
-            callback = lambda success, out_path, fp=file_path: file_converted(success, out_path, fp)
-            
-            stats['in_progress'] += 1
-            self.convert_file_async(str(file_path), output_path, None, callback)
+        if completion_callback:
+            completion_callback(stats)
         
         return stats
     
@@ -408,7 +1031,10 @@ class DoclingToMarkdownConverter:
             if completion_callback:
                 completion_callback(stats)
         
-        self.executor.submit(_convert_and_notify)
+        # La orquestación corre en su propio hilo y no en el pool: si ocupara un
+        # hilo del pool mientras espera a los archivos que envía a ese mismo pool,
+        # varios directorios a la vez podrían bloquearlo por completo
+        threading.Thread(target=_convert_and_notify, daemon=True).start()
 
 def setup_logging():
     logging.basicConfig(
@@ -417,8 +1043,25 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
+@dataclass(slots=True)
+class ModeWidgets:
+    """Widgets y mensajes de una pestaña de conversión"""
+    progress_var: object
+    status_var: object
+    convert_button: object
+    cancel_button: object
+    download_button: object
+    success_message: str
+
 class DoclingConverterApp:
+    # Tipos de archivo del diálogo de selección, construidos una sola vez
+    _FILETYPES = (
+        ("Documentos", " ".join("*" + ext for ext in SUPPORTED_EXTENSIONS_TUPLE)),
+        ("Todos los archivos", "*.*")
+    )
+    
     def __init__(self, root):
+        _import_tk()
         self.root = root
         self.root.title("Docling a Markdown Converter")
         self.root.geometry("700x500")
@@ -427,6 +1070,20 @@ class DoclingConverterApp:
         self.converter = DoclingToMarkdownConverter()
         self.web_converter = WebToMarkdownConverter()
         self.setup_ui()
+        self.modes = {
+            "file": ModeWidgets(self.progress_var, self.status_var, self.convert_button,
+                                self.cancel_button, self.download_button,
+                                "Documento convertido exitosamente"),
+            "web": ModeWidgets(self.web_progress_var, self.web_status_var, self.web_convert_button,
+                               self.web_cancel_button, self.web_download_button,
+                               "Página web convertida exitosamente"),
+            "youtube": ModeWidgets(self.yt_progress_var, self.yt_status_var, self.yt_convert_button,
+                                   self.yt_cancel_button, self.yt_download_button,
+                                   "Video de YouTube convertido exitosamente"),
+        }
+        # Callbacks de cada modo, creados una sola vez
+        self._progress_cbs = {m: partial(self.update_progress, mode=m) for m in self.modes}
+        self._completion_cbs = {m: partial(self.conversion_completed, mode=m) for m in self.modes}
         self.temp_dir = Path("temp_output")
         ensure_directory_exists(self.temp_dir)
         self.input_file = None
@@ -435,6 +1092,24 @@ class DoclingConverterApp:
         self.output_file_path = None
         self.current_mode = None
         
+        # Bucle de asyncio en un hilo propio para las conversiones web y de YouTube;
+        # Tk sigue en el hilo principal y recibe los resultados con root.after
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self._http_session = None
+        self._url_future = None
+        # Cancelación de la conversión de URL en curso; cada conversión tiene la suya
+        self._url_cancel_event = None
+        
+        # Progreso pendiente de mostrar, agrupado por modo
+        self._pending_progress = {}
+        self._progress_flush_scheduled = False
+        self._progress_lock = threading.Lock()
+        
+        # Pool pequeño y propio para guardar archivos, para no esperar detrás de
+        # las conversiones del pool compartido
+        self.io_pool = ThreadPoolExecutor(max_workers=2)
+        
     def setup_ui(self):
         # Crear frame principal
         main_frame = ttk.Frame(self.root, padding="20")
@@ -630,8 +1305,7 @@ class DoclingConverterApp:
         self.yt_result_text.pack(fill=tk.BOTH, expand=True)
     
     def browse_file(self):
-        filetypes = [("Documentos", " ".join(["*" + ext for ext in get_supported_extensions()])), ("Todos los archivos", "*.*")]
-        filename = filedialog.askopenfilename(title="Seleccionar archivo", filetypes=filetypes)
+        filename = filedialog.askopenfilename(title="Seleccionar archivo", filetypes=self._FILETYPES)
         if filename:
             self.file_path_var.set(filename)
             self.input_file = filename
@@ -648,28 +1322,6 @@ class DoclingConverterApp:
                 self.status_var.set(f"Archivo seleccionado ({size_mb:.1f} MB): {file_path.name}")
                 self.time_label.config(text="")
     
-    def update_progress(self, value):
-        """Actualiza la barra de progreso desde un hilo secundario"""
-        self.root.after(0, lambda: self.progress_var.set(value))
-    
-    def conversion_completed(self, success, output_path):
-        """Callback llamado cuando se completa la conversión"""
-        self.conversion_in_progress = False
-        
-        if success:
-            self.output_file = output_path
-            self.root.after(0, lambda: self.status_var.set("Conversión completada exitosamente"))
-            self.root.after(0, lambda: self.download_button.config(state=tk.NORMAL))
-            self.root.after(0, lambda: messagebox.showinfo("Éxito", "Documento convertido exitosamente"))
-        else:
-            self.root.after(0, lambda: self.status_var.set("Error en la conversión"))
-            self.root.after(0, lambda: self.progress_var.set(0))
-            self.root.after(0, lambda: messagebox.showerror("Error", "No se pudo convertir el documento"))
-        
-        # Restaurar estado de los botones
-        self.root.after(0, lambda: self.convert_button.config(state=tk.NORMAL))
-        self.root.after(0, lambda: self.cancel_button.config(state=tk.DISABLED))
-    
     def start_conversion(self, mode="file"):
         """Inicia el proceso de conversión"""
         if self.conversion_in_progress:
@@ -695,12 +1347,13 @@ class DoclingConverterApp:
             self.progress_var.set(0)
             self.status_var.set("Iniciando conversión...")
             
-            # Iniciar la conversión en un hilo separado
+            # Iniciar la conversión en un hilo separado; los callbacks se
+            # reenvían al hilo de Tk con root.after para no tocar widgets desde el worker
             self.converter.convert_file_async(
                 input_path, 
                 self.output_file_path, 
-                lambda p: self.update_progress(p, mode), 
-                lambda s, o: self.conversion_completed(s, o, mode)
+                self._progress_cbs[mode], 
+                self._completion_cbs[mode]
             )
             
         elif mode == "web":
@@ -710,14 +1363,7 @@ class DoclingConverterApp:
                 return
             
             # Preparar la ruta de salida temporal
-            from urllib.parse import urlparse
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.replace("www.", "")
-            path = parsed_url.path.strip("/").replace("/", "_")
-            if not path:
-                path = "index"
-            output_filename = f"{domain}_{path}.md"
-            self.output_file_path = str(self.temp_dir / output_filename)
+            self.output_file_path = derive_output_path(url, str(self.temp_dir))
             
             # Actualizar la interfaz
             self.conversion_in_progress = True
@@ -727,13 +1373,8 @@ class DoclingConverterApp:
             self.web_progress_var.set(0)
             self.web_status_var.set("Iniciando conversión...")
             
-            # Iniciar la conversión en un hilo separado
-            self.web_converter.convert_url_async(
-                url, 
-                self.output_file_path, 
-                lambda p: self.update_progress(p, mode), 
-                lambda s, o: self.conversion_completed(s, o, mode)
-            )
+            # Iniciar la conversión en el bucle de asyncio
+            self._start_url_conversion(url, mode)
             
         elif mode == "youtube":
             url = self.yt_url_var.get()
@@ -747,10 +1388,7 @@ class DoclingConverterApp:
                 return
             
             # Preparar la ruta de salida temporal
-            from urllib.parse import urlparse
-            parsed_url = urlparse(url)
-            video_id = parsed_url.query.split('v=')[-1].split('&')[0] if 'v=' in parsed_url.query else parsed_url.path.split('/')[-1]
-            output_filename = f"youtube_{video_id}.md"
+            output_filename = f"youtube_{youtube_video_id(url)}.md"
             self.output_file_path = str(self.temp_dir / output_filename)
             
             # Actualizar la interfaz
@@ -761,77 +1399,121 @@ class DoclingConverterApp:
             self.yt_progress_var.set(0)
             self.yt_status_var.set("Iniciando conversión...")
             
-            # Iniciar la conversión en un hilo separado
+            # Iniciar la conversión en el bucle de asyncio
+            self._start_url_conversion(url, mode)
+    
+    def _start_url_conversion(self, url, mode):
+        """Lanza la conversión de una URL en el bucle de asyncio de la aplicación"""
+        output_path = self.output_file_path
+        # La conversión puede seguir en un hilo del pool tras cancelarla: con su
+        # propio evento deja de informar progreso y no escribe el resultado
+        cancel_event = threading.Event()
+        self._url_cancel_event = cancel_event
+        progress_callback = partial(self.update_progress, mode=mode, cancel_event=cancel_event)
+        
+        if aiohttp is None:
+            # Sin aiohttp se usa el conversor síncrono en el pool de hilos
+            def on_result(success, path):
+                # Una conversión cancelada ya restauró la interfaz en cancel_conversion
+                if not cancel_event.is_set():
+                    self.conversion_completed(success, path, mode)
+            
             self.web_converter.convert_url_async(
                 url, 
-                self.output_file_path, 
-                lambda p: self.update_progress(p, mode), 
-                lambda s, o: self.conversion_completed(s, o, mode)
+                output_path, 
+                progress_callback, 
+                on_result,
+                cancel_event
             )
+            return
+        
+        def on_done(future):
+            # Una conversión cancelada ya restauró la interfaz en cancel_conversion
+            if future.cancelled() or cancel_event.is_set():
+                return
+            success = future.exception() is None and future.result()
+            self.conversion_completed(success, output_path, mode)
+        
+        self._url_future = asyncio.run_coroutine_threadsafe(
+            self._convert_url(url, output_path, progress_callback, cancel_event), self.loop
+        )
+        self._url_future.add_done_callback(on_done)
+    
+    async def _convert_url(self, url, output_path, progress_callback, cancel_event):
+        # La sesión se crea dentro del bucle y se reutiliza en las siguientes conversiones
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return await self.web_converter.convert_url_aio(
+            self._http_session, url, output_path, progress_callback, cancel_event
+        )
+    
+    def close(self):
+        """Cierra la sesión HTTP y detiene el bucle de asyncio"""
+        if self._http_session is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._http_session.close(), self.loop).result(timeout=5)
+            except Exception as e:
+                logger.warning("No se pudo cerrar la sesión HTTP: %s", e)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+    
+    def update_progress(self, progress, mode="file", cancel_event=None):
+        """Actualiza la barra de progreso desde un hilo secundario"""
+        # Se guarda solo el último valor de cada modo y se vuelca a Tk como
+        # mucho unas 30 veces por segundo
+        with self._progress_lock:
+            # Se comprueba bajo el cerrojo: cancel_conversion activa el evento con
+            # él tomado, así que ningún valor tardío se cuela tras la cancelación
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            self._pending_progress[mode] = progress
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
+        self.root.after(33, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Aplica en la interfaz el último progreso pendiente de cada modo"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = {}
+            self._progress_flush_scheduled = False
+        for mode, progress in pending.items():
+            self._show_progress(progress, mode)
     
-    def update_progress(self, progress, mode="file"):
+    def _pop_progress(self, mode):
+        """Retira el progreso pendiente de un modo que ya terminó y lo devuelve (o None)"""
+        with self._progress_lock:
+            return self._pending_progress.pop(mode, None)
+    
+    def _show_progress(self, progress, mode="file"):
         """Actualiza el progreso en la interfaz"""
-        if mode == "file":
-            self.progress_var.set(progress)
-            if progress < 100:
-                self.status_var.set(f"Convirtiendo... {progress:.1f}%")
-            else:
-                self.status_var.set("Conversión completada")
-        elif mode == "web":
-            self.web_progress_var.set(progress)
-            if progress < 100:
-                self.web_status_var.set(f"Convirtiendo... {progress:.1f}%")
-            else:
-                self.web_status_var.set("Conversión completada")
-        elif mode == "youtube":
-            self.yt_progress_var.set(progress)
-            if progress < 100:
-                self.yt_status_var.set(f"Convirtiendo... {progress:.1f}%")
-            else:
-                self.yt_status_var.set("Conversión completada")
+        m = self.modes[mode]
+        m.progress_var.set(progress)
+        m.status_var.set(f"Convirtiendo... {progress:.1f}%" if progress < 100 else "Conversión completada")
     
     def conversion_completed(self, success, output_path, mode="file"):
+        """Callback llamado desde el hilo de conversión cuando esta termina"""
+        self.root.after(0, self._finalize_ui, success, output_path, mode)
+    
+    def _finalize_ui(self, success, output_path, mode="file"):
         """Maneja la finalización de la conversión"""
         self.conversion_in_progress = False
+        # _finalize_ui puede adelantarse al volcado pendiente, así que el valor
+        # final se aplica aquí en lugar de esperar a _flush_progress
+        self._pop_progress(mode)
+        m = self.modes[mode]
+        m.convert_button.config(state=tk.NORMAL)
+        m.cancel_button.config(state=tk.DISABLED)
         
-        if mode == "file":
-            self.convert_button.config(state=tk.NORMAL)
-            self.cancel_button.config(state=tk.DISABLED)
-            
-            if success:
-                self.download_button.config(state=tk.NORMAL)
-                self.status_var.set("Conversión completada con éxito")
-                messagebox.showinfo("Éxito", "Documento convertido exitosamente")
-            else:
-                self.status_var.set("Error en la conversión")
-                self.progress_var.set(0)
-                messagebox.showerror("Error", "No se pudo completar la conversión")
-                
-        elif mode == "web":
-            self.web_convert_button.config(state=tk.NORMAL)
-            self.web_cancel_button.config(state=tk.DISABLED)
-            
-            if success:
-                self.web_download_button.config(state=tk.NORMAL)
-                self.web_status_var.set("Conversión completada con éxito")
-                messagebox.showinfo("Éxito", "Página web convertida exitosamente")
-            else:
-                self.web_status_var.set("Error en la conversión")
-                self.web_progress_var.set(0)
-                messagebox.showerror("Error", "No se pudo completar la conversión")
-                
-        elif mode == "youtube":
-            self.yt_convert_button.config(state=tk.NORMAL)
-            self.yt_cancel_button.config(state=tk.DISABLED)
-            
-            if success:
-                self.yt_download_button.config(state=tk.NORMAL)
-                self.yt_status_var.set("Conversión completada con éxito")
-                messagebox.showinfo("Éxito", "Video de YouTube convertido exitosamente")
-            else:
-                self.yt_status_var.set("Error en la conversión")
-                self.yt_progress_var.set(0)
-                messagebox.showerror("Error", "No se pudo completar la conversión")
+        if success:
+            m.download_button.config(state=tk.NORMAL)
+            m.progress_var.set(100)
+            m.status_var.set("Conversión completada con éxito")
+            messagebox.showinfo("Éxito", m.success_message)
+        else:
+            m.status_var.set("Error en la conversión")
+            m.progress_var.set(0)
+            messagebox.showerror("Error", "No se pudo completar la conversión")
     
     def cancel_conversion(self, mode="file"):
         """Cancela la conversión en curso"""
@@ -840,26 +1522,28 @@ class DoclingConverterApp:
         
         if mode == "file":
             self.converter.cancel_conversion()
-            self.status_var.set("Conversión cancelada")
-            self.conversion_in_progress = False
-            self.convert_button.config(state=tk.NORMAL)
-            self.cancel_button.config(state=tk.DISABLED)
-        elif mode == "web":
-            self.web_converter.cancel_conversion()
-            self.web_status_var.set("Conversión cancelada")
-            self.conversion_in_progress = False
-            self.web_convert_button.config(state=tk.NORMAL)
-            self.web_cancel_button.config(state=tk.DISABLED)
-        elif mode == "youtube":
+        else:
             self.web_converter.cancel_conversion()
-            self.yt_status_var.set("Conversión cancelada")
-            self.conversion_in_progress = False
-            self.yt_convert_button.config(state=tk.NORMAL)
-            self.yt_cancel_button.config(state=tk.DISABLED)
+            if self._url_cancel_event is not None:
+                with self._progress_lock:
+                    self._url_cancel_event.set()
+            if self._url_future is not None:
+                self._url_future.cancel()
+        
+        # La barra queda en el último progreso alcanzado, aunque no se hubiera volcado
+        progress = self._pop_progress(mode)
+        m = self.modes[mode]
+        if progress is not None:
+            m.progress_var.set(progress)
+        m.status_var.set("Conversión cancelada")
+        self.conversion_in_progress = False
+        m.convert_button.config(state=tk.NORMAL)
+        m.cancel_button.config(state=tk.DISABLED)
     
     def download_file(self, mode="file"):
         """Permite al usuario descargar el archivo convertido"""
-        if not self.output_file_path or not Path(self.output_file_path).exists():
+        output_file = Path(self.output_file_path) if self.output_file_path else None
+        if output_file is None or not output_file.exists():
             messagebox.showerror("Error", "No hay archivo para descargar")
             return
         
@@ -867,43 +1551,55 @@ class DoclingConverterApp:
         save_path = filedialog.asksaveasfilename(
             defaultextension=".md",
             filetypes=[("Markdown", "*.md"), ("Todos los archivos", "*.*")],
-            initialfile=Path(self.output_file_path).name
+            initialfile=output_file.name
         )
         
         if not save_path:
             return
         
+        # Guardar fuera del hilo de Tk para que la interfaz no se congele. Se copia
+        # siempre desde el archivo temporal (solo contenido, sin metadatos, con la
+        # copia rápida del kernel) para que cada descarga sea independiente y
+        # nunca se mueva un archivo que el usuario ya guardó
+        future = self.io_pool.submit(shutil.copyfile, self.output_file_path, save_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_copy_done, f, save_path, mode)
+        )
+    
+    def _on_copy_done(self, future, save_path, mode="file"):
+        """Informa del resultado de guardar el archivo convertido"""
         try:
-            # Copiar el archivo
-            shutil.copy2(self.output_file_path, save_path)
-            
-            # Actualizar estado según el modo
-            if mode == "file":
-                self.status_var.set(f"Archivo guardado en: {save_path}")
-            elif mode == "web":
-                self.web_status_var.set(f"Archivo guardado en: {save_path}")
-            elif mode == "youtube":
-                self.yt_status_var.set(f"Archivo guardado en: {save_path}")
-                
+            future.result()
+            self.modes[mode].status_var.set(f"Archivo guardado en: {save_path}")
             messagebox.showinfo("Éxito", f"Archivo guardado en:\n{save_path}")
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(e)}")
-            logging.error(f"Error al guardar el archivo: {e}")
+            logger.error("Error al guardar el archivo: %s", e)
 
 def main():
     """Función principal que inicia la aplicación GUI"""
     setup_logging()
+    
+    # uvloop acelera el bucle de asyncio de las descargas; solo existe en POSIX
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    # Borrar en segundo plano lo que quedó pendiente de ejecuciones anteriores
+    sweep_discarded_directories(Path("temp_output"))
+    
+    _import_tk()
     root = tk.Tk()
     app = DoclingConverterApp(root)
     root.mainloop()
+    app.close()
     
     # Limpiar archivos temporales al salir
     temp_dir = Path("temp_output")
     if temp_dir.exists():
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+        discard_directory(temp_dir)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file